@@ -1,11 +1,11 @@
 import os
 import sys
+import numpy as np
 import pandas as pd
 from networksecurity.entity.config_entity import DataValidationConfig, TrainingPipelineConfig
 from networksecurity.entity.artifact_entity import DataIngestionArtifact
 from networksecurity.components.data_validation import DataValidation
-from networksecurity.constant.training_pipeline import SCHEMA_FILE_PATH
-from networksecurity.utils.main_utils.utils import read_yaml_file
+from networksecurity.utils.main_utils.utils import load_schema_config, copy_file
 
 def verify_validation():
     try:
@@ -15,16 +15,15 @@ def verify_validation():
         test_path = "dummy_data/test.csv"
         
         # Load schema to know what columns to create
-        schema = read_yaml_file(SCHEMA_FILE_PATH)
+        schema = load_schema_config()
         columns = [list(x.keys())[0] for x in schema['columns']]
         
-        # Create dummy dataframe with correct columns
-        df = pd.DataFrame(columns=columns)
-        # Add a dummy row with random values (all 0 for simplicity)
-        df.loc[0] = [0] * len(columns)
+        # Create dummy dataframe with correct columns and a single all-zero row
+        df = pd.DataFrame(np.zeros((1, len(columns)), dtype=np.int64), columns=columns)
         
+        # Train and test are identical, so write once and copy
         df.to_csv(train_path, index=False)
-        df.to_csv(test_path, index=False)
+        copy_file(train_path, test_path)
         
         print("Dummy data created.")
 
@@ -1,21 +1,186 @@
 import os
 import sys
-import certifi
-ca = certifi.where()
-
-from dotenv import load_dotenv
-load_dotenv()
 
 import pandas as pd
 import numpy as np
-import pymongo
-from typing import List
-from sklearn.model_selection import train_test_split
+import pyarrow as pa
+from bson import ObjectId
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+from sklearn.model_selection import ShuffleSplit
 
 from networksecurity.exception.exception import NetworkSecurityException
 from networksecurity.logging.logger import logging
 from networksecurity.entity.config_entity import DataIngestionConfig
 from networksecurity.entity.artifact_entity import DataIngestionArtifact
+from networksecurity.utils.main_utils.utils import dataframe_to_table, write_csv_file, write_parquet_file
+from networksecurity.utils.mongo_utils.utils import get_mongo_client
+
+
+# Largest integer magnitude float64 holds exactly
+_MAX_EXACT_FLOAT_INT = 2 ** 53
+_INT64 = np.iinfo(np.int64)
+
+
+def _is_int(value) -> bool:
+    # bson decodes large integers as Int64, an int subclass; bool is one too but is kept apart
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _exact_as_float(values: np.ndarray) -> bool:
+    return bool(((values >= -_MAX_EXACT_FLOAT_INT) & (values <= _MAX_EXACT_FLOAT_INT)).all())
+
+
+class _ColumnBuffer:
+    """
+    Growable array for one field that never changes a value it stores.
+    Integers are held as int64 with a presence mask and floats as float64 with NaN
+    for missing rows. A value the current array cannot hold exactly (a bool, a string,
+    an int beyond int64, a large int among floats) moves the column to object, so
+    validation sees what was stored in MongoDB.
+    """
+
+    def __init__(self, kind: str, capacity: int):
+        self.kind = kind
+        self.present = None
+        if kind == "i":
+            self.values = np.zeros(capacity, dtype=np.int64)
+            self.present = np.zeros(capacity, dtype=bool)
+        elif kind == "f":
+            self.values = np.full(capacity, np.nan)
+        else:
+            self.values = np.full(capacity, np.nan, dtype=object)
+
+    def grow(self, capacity: int) -> None:
+        extra = capacity - len(self.values)
+        if self.kind == "i":
+            self.values = np.concatenate([self.values, np.zeros(extra, dtype=np.int64)])
+            self.present = np.concatenate([self.present, np.zeros(extra, dtype=bool)])
+        else:
+            self.values = np.concatenate([self.values, np.full(extra, np.nan, dtype=self.values.dtype)])
+
+    def set(self, row: int, value) -> None:
+        if value is None or (isinstance(value, str) and value == "na"):
+            return
+        if self.kind == "i":
+            if _is_int(value) and _INT64.min <= value <= _INT64.max:
+                self.values[row] = value
+                self.present[row] = True
+                return
+            if isinstance(value, float) and _exact_as_float(self.values[self.present]):
+                self._to_float()
+            else:
+                self._to_object()
+        if self.kind == "f":
+            if isinstance(value, float) or (_is_int(value) and abs(value) <= _MAX_EXACT_FLOAT_INT):
+                self.values[row] = value
+                return
+            self._to_object()
+        self.values[row] = value
+
+    def finish(self, n_rows: int) -> np.ndarray:
+        # Integers with missing rows become float64 as before, unless that would round them
+        if self.kind == "i" and not self.present[:n_rows].all():
+            if _exact_as_float(self.values[self.present]):
+                self._to_float()
+            else:
+                self._to_object()
+        values = self.values[:n_rows]
+        if self.kind == "O" and n_rows and all(isinstance(value, bool) for value in values):
+            return values.astype(bool)
+        return values
+
+    def _to_float(self) -> None:
+        values = self.values.astype(np.float64)
+        values[~self.present] = np.nan
+        self.values, self.present, self.kind = values, None, "f"
+
+    def _to_object(self) -> None:
+        values = self.values.astype(object)
+        if self.kind == "i":
+            values[~self.present] = np.nan
+        self.values, self.present, self.kind = values, None, "O"
+
+
+def _buffer_kind(value) -> str:
+    """
+    Initial buffer type for a field, from the first value seen for it
+    """
+    if _is_int(value):
+        return "i"
+    if value is None or isinstance(value, float) or (isinstance(value, str) and value == "na"):
+        return "f"
+    return "O"
+
+
+def _read_documents(cursor, n_rows: int) -> Dict[str, np.ndarray]:
+    """
+    Decode a cursor into per-column arrays preallocated for n_rows documents.
+    Columns are created and typed as fields first appear, so every stored field is kept
+    and a field no document has stays absent. "na" and fields a document lacks become
+    NaN. The buffers grow if the estimate was too small.
+    """
+    buffers = {}
+    capacity = n_rows
+    n_filled = 0
+    for document in cursor:
+        if n_filled == capacity:
+            capacity = max(2 * capacity, 1)
+            for buffer in buffers.values():
+                buffer.grow(capacity)
+        for name, value in document.items():
+            buffer = buffers.get(name)
+            if buffer is None:
+                buffer = buffers[name] = _ColumnBuffer(_buffer_kind(value), capacity)
+            buffer.set(n_filled, value)
+        n_filled += 1
+    return {name: buffer.finish(n_filled) for name, buffer in buffers.items()}
+
+
+def _concat_columns(parts: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """
+    Join per-range column arrays; a field missing from a range is NaN for its rows.
+    Ranges that disagree on dtype are joined as float64 only when that is exact,
+    otherwise as object.
+    """
+    parts = [part for part in parts if part]
+    names = list(dict.fromkeys(name for part in parts for name in part))
+    columns = {}
+    for name in names:
+        chunks = [
+            part[name] if name in part else np.full(len(next(iter(part.values()))), np.nan)
+            for part in parts
+        ]
+        dtypes = {chunk.dtype for chunk in chunks}
+        if len(dtypes) > 1 and not (
+            all(dtype.kind in "if" for dtype in dtypes)
+            and all(_exact_as_float(chunk) for chunk in chunks if chunk.dtype.kind == "i")
+        ):
+            chunks = [chunk.astype(object) for chunk in chunks]
+        columns[name] = np.concatenate(chunks)
+    return columns
+
+
+def _object_id_ranges(collection, n_ranges: int) -> List[dict]:
+    """
+    Split the collection's ObjectId _id span into n_ranges query filters.
+    Falls back to a single match-all filter for empty collections or non-ObjectId keys.
+    """
+    first = collection.find_one({}, projection={"_id": 1}, sort=[("_id", 1)])
+    last = collection.find_one({}, projection={"_id": 1}, sort=[("_id", -1)])
+    if first is None or not isinstance(first["_id"], ObjectId) or not isinstance(last["_id"], ObjectId):
+        return [{}]
+
+    lo = int(str(first["_id"]), 16)
+    hi = int(str(last["_id"]), 16)
+    bounds = sorted({lo + (hi - lo) * k // n_ranges for k in range(n_ranges)})
+
+    filters = []
+    for start, end in zip(bounds, bounds[1:]):
+        filters.append({"_id": {"$gte": ObjectId(f"{start:024x}"), "$lt": ObjectId(f"{end:024x}")}})
+    # The last range is closed so the newest document is included
+    filters.append({"_id": {"$gte": ObjectId(f"{bounds[-1]:024x}"), "$lte": last["_id"]}})
+    return filters
 
 
 class DataIngestion:
@@ -50,23 +215,32 @@ class DataIngestion:
             database_name = self.data_ingestion_config.database_name
             collection_name = self.data_ingestion_config.collection_name
             
-            # Connect to MongoDB
-            mongo_client = pymongo.MongoClient(os.getenv("MONGO_DB_URL"), tlsCAFile=ca)
+            # Reuse the pooled MongoDB client
+            mongo_client = get_mongo_client()
             
             logging.info(f"Connected to MongoDB. Database: {database_name}, Collection: {collection_name}")
             
             # Access database and collection
             collection = mongo_client[database_name][collection_name]
             
-            # Convert collection to DataFrame
-            df = pd.DataFrame(list(collection.find()))
+            queries = _object_id_ranges(collection, self.data_ingestion_config.read_workers)
             
-            # Drop MongoDB's _id column if it exists
-            if "_id" in df.columns:
-                df = df.drop(columns=["_id"], axis=1)
+            # Pre-size each range's buffers from the metadata count; ranges that hold more grow
+            n_rows = -(-collection.estimated_document_count() // len(queries))
             
-            # Replace 'na' with NaN
-            df.replace({"na": np.nan}, inplace=True)
+            def read_range(query: dict) -> Dict[str, np.ndarray]:
+                # All fields are kept for validation; only _id is excluded server-side
+                cursor = collection.find(query, projection={"_id": 0}, batch_size=10_000)
+                return _read_documents(cursor, n_rows)
+            
+            # Read _id ranges on parallel cursors; the driver releases the GIL on network IO
+            with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+                parts = list(executor.map(read_range, queries))
+            
+            columns = _concat_columns(parts)
+            
+            # Columns already carry their final dtype, so the frame wraps them without copying
+            df = pd.DataFrame(columns, copy=False)
             
             logging.info(f"Data exported successfully. Shape: {df.shape}")
             
@@ -75,15 +249,15 @@ class DataIngestion:
         except Exception as e:
             raise NetworkSecurityException(e, sys)
     
-    def export_data_into_feature_store(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+    def export_data_into_feature_store(self, table: pa.Table) -> pa.Table:
         """
-        Export DataFrame to feature store as CSV file
+        Export data to feature store as a Parquet file
         
         Args:
-            dataframe: DataFrame to be exported
+            table: Arrow table to be exported
             
         Returns:
-            pd.DataFrame: The same dataframe that was saved
+            pa.Table: The same table that was saved
         """
         try:
             logging.info("Exporting data to feature store")
@@ -94,56 +268,62 @@ class DataIngestion:
             dir_path = os.path.dirname(feature_store_file_path)
             os.makedirs(dir_path, exist_ok=True)
             
-            # Save DataFrame to CSV
-            dataframe.to_csv(feature_store_file_path, index=False, header=True)
+            # Save table to Parquet
+            write_parquet_file(feature_store_file_path, table)
             
             logging.info(f"Data saved to feature store at: {feature_store_file_path}")
             
-            return dataframe
+            return table
             
         except Exception as e:
             raise NetworkSecurityException(e, sys)
     
-    def split_data_as_train_test(self, dataframe: pd.DataFrame) -> None:
+    def split_data_as_train_test(self, dataframe: pd.DataFrame) -> Tuple[pa.Table, pa.Table]:
         """
         Split the dataframe into train and test sets and save them
         
         Args:
             dataframe: DataFrame to be split
+            
+        Returns:
+            Tuple[pa.Table, pa.Table]: The train and test sets that were saved
         """
         try:
             logging.info("Splitting data into train and test sets")
             
-            # Perform train-test split
-            train_set, test_set = train_test_split(
-                dataframe, 
+            # Compute split indices once (same split as train_test_split with random_state=42)
+            splitter = ShuffleSplit(
+                n_splits=1,
                 test_size=self.data_ingestion_config.train_test_split_ratio,
                 random_state=42
             )
+            train_idx, test_idx = next(splitter.split(np.empty((len(dataframe), 0))))
+            
+            # Convert once and let Arrow gather the rows instead of copying the frame twice
+            table = dataframe_to_table(dataframe)
+            train_table = table.take(pa.array(train_idx))
+            test_table = table.take(pa.array(test_idx))
             
-            logging.info(f"Train set shape: {train_set.shape}, Test set shape: {test_set.shape}")
+            logging.info(f"Train set shape: {train_table.shape}, Test set shape: {test_table.shape}")
             
             # Create directory for train and test files
             dir_path = os.path.dirname(self.data_ingestion_config.training_file_path)
             os.makedirs(dir_path, exist_ok=True)
             
-            # Save train set
-            train_set.to_csv(
-                self.data_ingestion_config.training_file_path,
-                index=False,
-                header=True
-            )
-            
-            # Save test set
-            test_set.to_csv(
-                self.data_ingestion_config.testing_file_path,
-                index=False,
-                header=True
-            )
+            # Save train and test sets concurrently; pyarrow releases the GIL while writing
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(write_csv_file, self.data_ingestion_config.training_file_path, train_table),
+                    executor.submit(write_csv_file, self.data_ingestion_config.testing_file_path, test_table)
+                ]
+                for future in futures:
+                    future.result()
             
             logging.info(f"Train data saved to: {self.data_ingestion_config.training_file_path}")
             logging.info(f"Test data saved to: {self.data_ingestion_config.testing_file_path}")
             
+            return train_table, test_table
+            
         except Exception as e:
             raise NetworkSecurityException(e, sys)
     
@@ -162,11 +342,11 @@ class DataIngestion:
             # Step 1: Export data from MongoDB
             dataframe = self.export_collection_as_dataframe()
             
-            # Step 2: Save data to feature store
-            dataframe = self.export_data_into_feature_store(dataframe)
+            # Step 2: Split data into train and test sets
+            train_table, test_table = self.split_data_as_train_test(dataframe)
             
-            # Step 3: Split data into train and test sets
-            self.split_data_as_train_test(dataframe)
+            # Step 3: Save data to feature store, reusing the converted split tables
+            self.export_data_into_feature_store(pa.concat_tables([train_table, test_table]))
             
             logging.info("Data Ingestion process completed successfully")
             logging.info("="*70)
@@ -189,10 +369,6 @@ if __name__ == "__main__":
     Test the DataIngestion component
     """
     from networksecurity.entity.config_entity import TrainingPipelineConfig
-    from dotenv import load_dotenv
-    
-    # Load environment variables
-    load_dotenv()
     
     # Create pipeline config
     training_pipeline_config = TrainingPipelineConfig()
@@ -1,14 +1,143 @@
 import os
 import sys
+import math
+from typing import Tuple
+import numpy as np
 import pandas as pd
-from scipy.stats import ks_2samp
+from numba import njit, prange
+from scipy.stats import kstwo
 
 from networksecurity.exception.exception import NetworkSecurityException
 from networksecurity.logging.logger import logging
 from networksecurity.entity.config_entity import DataValidationConfig
 from networksecurity.entity.artifact_entity import DataIngestionArtifact, DataValidationArtifact
-from networksecurity.constant.training_pipeline import SCHEMA_FILE_PATH
-from networksecurity.utils.main_utils.utils import read_yaml_file, write_yaml_file
+from networksecurity.utils.main_utils.utils import load_schema_config, write_json_file, write_csv_file, copy_file
+
+
+def _quantize_for_ks(base: np.ndarray, current: np.ndarray):
+    """
+    Narrow the drift inputs before sorting. KS only depends on the ordering of
+    values, so integer data with a small range is mapped onto exact uint16 codes
+    (monotone, hence the same statistic); everything else stays float64.
+    Integrality is checked on the values themselves, not taken from the schema,
+    so a fractional value in an int64 column keeps its own code.
+    """
+    if (base.size and current.size
+            and np.array_equal(base, np.rint(base)) and np.array_equal(current, np.rint(current))):
+        # NaN compares unequal to itself, so columns with missing values never get here
+        lo = np.minimum(base.min(axis=0), current.min(axis=0))
+        hi = np.maximum(base.max(axis=0), current.max(axis=0))
+        if (hi - lo).max() <= np.iinfo(np.uint16).max and max(-lo.min(), hi.max()) <= 2 ** 53:
+            return (base - lo).astype(np.uint16), (current - lo).astype(np.uint16)
+    return base, current
+
+
+@njit(parallel=True, cache=True)
+def _ks_statistic_columns(base, current):
+    """
+    KS statistic for every column, one column per core. Each column is sorted
+    and both empirical CDFs are walked together, evaluating after each value run.
+    A column with NaN in either sample gets a NaN statistic, like ks_2samp's
+    default nan_policy="propagate".
+    """
+    n1 = base.shape[0]
+    n2 = current.shape[0]
+    n_cols = base.shape[1]
+    statistic = np.empty(n_cols)
+    for j in prange(n_cols):
+        sa = np.sort(base[:, j])
+        sb = np.sort(current[:, j])
+        # NaN sorts last; it would also stall the walk below since comparisons with it are False
+        if sa[n1 - 1] != sa[n1 - 1] or sb[n2 - 1] != sb[n2 - 1]:
+            statistic[j] = np.nan
+            continue
+        i = 0
+        k = 0
+        d = 0.0
+        while i < n1 and k < n2:
+            value = min(sa[i], sb[k])
+            while i < n1 and sa[i] <= value:
+                i += 1
+            while k < n2 and sb[k] <= value:
+                k += 1
+            diff = abs(i / n1 - k / n2)
+            if diff > d:
+                d = diff
+        statistic[j] = d
+    return statistic
+
+
+# Largest sample size for which p-values are exact, the same cutover as ks_2samp(method="auto")
+_KS_MAX_EXACT_N = 10000
+
+
+@njit(parallel=True, cache=True)
+def _ks_exact_pvalues(statistic, n1, n2, n1g, n2g):
+    """
+    Exact two-sided KS p-values, as ks_2samp computes them for small samples.
+    Walks the lattice of merge orders of the two samples, keeping only the band
+    of points whose CDF gap is below the observed statistic, and sums the
+    probability of stepping out of that band.
+    """
+    lcm = n1g * n2
+    pvalue = np.empty(statistic.shape[0])
+    for c in prange(statistic.shape[0]):
+        if statistic[c] != statistic[c]:
+            pvalue[c] = np.nan
+            continue
+        # CDF gaps are multiples of 1/lcm; work in those integer units
+        h = int(np.round(statistic[c] * lcm))
+        if h == 0:
+            pvalue[c] = 1.0
+            continue
+        cur = np.zeros(n2 + 1)
+        nxt = np.zeros(n2 + 1)
+        cur[0] = 1.0
+        p_out = 0.0
+        for i in range(n1 + 1):
+            # Row i of the band: |i * n2g - j * n1g| < h
+            j_lo = max(0, (i * n2g - h) // n1g + 1)
+            j_hi = min(n2, -((-(i * n2g + h)) // n1g) - 1)
+            for j in range(j_lo, j_hi + 1):
+                mass = cur[j]
+                remaining = n1 + n2 - i - j
+                if mass == 0.0 or remaining == 0:
+                    continue
+                p_right = mass * (n2 - j) / remaining
+                p_down = mass * (n1 - i) / remaining
+                if j < j_hi:
+                    cur[j + 1] += p_right
+                else:
+                    p_out += p_right
+                if abs((i + 1) * n2g - j * n1g) < h:
+                    nxt[j] += p_down
+                else:
+                    p_out += p_down
+            cur[j_lo:j_hi + 1] = 0.0
+            cur, nxt = nxt, cur
+        pvalue[c] = min(p_out, 1.0)
+    return pvalue
+
+
+def _ks_2samp_columns(base: np.ndarray, current: np.ndarray):
+    """
+    Two-sample KS test on every column of two 2D arrays at once
+
+    Returns the KS statistic and the two-sided p-value per column, exact up to
+    _KS_MAX_EXACT_N samples and asymptotic above, matching ks_2samp's defaults.
+    """
+    n1 = base.shape[0]
+    n2 = current.shape[0]
+
+    # Column-major layout keeps each column contiguous for the per-column sorts
+    statistic = _ks_statistic_columns(np.asfortranarray(base), np.asfortranarray(current))
+    if max(n1, n2) <= _KS_MAX_EXACT_N:
+        g = math.gcd(n1, n2)
+        pvalue = _ks_exact_pvalues(statistic, n1, n2, n1 // g, n2 // g)
+    else:
+        pvalue = np.clip(kstwo.sf(statistic, np.round(n1 * n2 / (n1 + n2))), 0, 1)
+    return statistic, pvalue
+
 
 class DataValidation:
     """
@@ -24,14 +153,17 @@ class DataValidation:
         try:
             self.data_ingestion_artifact = data_ingestion_artifact
             self.data_validation_config = data_validation_config
-            self._schema_config = read_yaml_file(SCHEMA_FILE_PATH)
+            self._schema_config = load_schema_config()
+            self._num_cols_set = frozenset(self._schema_config['numerical_columns'])
+            self._n_cols = len(self._schema_config['columns'])
         except Exception as e:
             raise NetworkSecurityException(e, sys)
     
     @staticmethod
     def read_data(file_path) -> pd.DataFrame:
         try:
-            return pd.read_csv(file_path)
+            # Multithreaded C parser with Arrow-backed columns
+            return pd.read_csv(file_path, engine="pyarrow", dtype_backend="pyarrow")
         except Exception as e:
             raise NetworkSecurityException(e, sys)
 
@@ -40,13 +172,10 @@ class DataValidation:
         Validate if all required columns are present
         """
         try:
-            number_of_columns = len(self._schema_config['columns'])
-            logging.info(f"Required number of columns: {number_of_columns}")
+            logging.info(f"Required number of columns: {self._n_cols}")
             logging.info(f"Dataframe has columns: {len(dataframe.columns)}")
             
-            if len(dataframe.columns) == number_of_columns:
-                return True
-            return False
+            return len(dataframe.columns) == self._n_cols
         except Exception as e:
             raise NetworkSecurityException(e, sys)
 
@@ -55,18 +184,28 @@ class DataValidation:
         Validate if all numerical columns from schema exist in dataframe
         """
         try:
-            numerical_columns = self._schema_config['numerical_columns']
-            dataframe_columns = dataframe.columns
-
-            missing_numerical_columns = []
-            for column in numerical_columns:
-                if column not in dataframe_columns:
-                    missing_numerical_columns.append(column)
-            
-            if len(missing_numerical_columns) > 0:
-                logging.info(f"Missing numerical columns: {missing_numerical_columns}")
-                return False
-            return True
+            if self._num_cols_set.issubset(dataframe.columns):
+                return True
+            
+            missing_numerical_columns = self._num_cols_set.difference(dataframe.columns)
+            logging.info(f"Missing numerical columns: {sorted(missing_numerical_columns)}")
+            return False
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def _validate_schema(self, dataframe: pd.DataFrame) -> Tuple[bool, bool]:
+        """
+        Check column count and numerical column presence in one pass over the columns
+        """
+        try:
+            columns = frozenset(dataframe.columns)
+            has_all_columns = len(columns) == self._n_cols
+            has_numerical_columns = self._num_cols_set.issubset(columns)
+            
+            logging.info(f"Required number of columns: {self._n_cols}, dataframe has columns: {len(columns)}")
+            if not has_numerical_columns:
+                logging.info(f"Missing numerical columns: {sorted(self._num_cols_set - columns)}")
+            return has_all_columns, has_numerical_columns
         except Exception as e:
             raise NetworkSecurityException(e, sys)
 
@@ -75,34 +214,26 @@ class DataValidation:
         Detect data drift between base and current datasets using KS test
         """
         try:
-            drift_status = False
-            report = {}
-            
-            for column in base_df.columns:
-                d1 = base_df[column]
-                d2 = current_df[column]
-                
-                # Perform KS test
-                is_same_dist = ks_2samp(d1, d2)
-                
-                # larger p-value means distributions are likely the same
-                # But here we probably want to check if they are DIFFERENT
-                # standard approach: if p_value < alpha, we reject H0 (same dist), so they are different (drift)
-                
-                if is_same_dist.pvalue >= threshold:
-                    # Same distribution
-                    is_found = False
-                else:
-                    # Different distribution -> Drift
-                    is_found = True
-                    drift_status = True 
-                
-                report.update({
-                    column: {
-                        "p_value": float(is_same_dist.pvalue),
-                        "drift_status": is_found
-                    }
-                })
+            columns = base_df.columns
+            base = base_df.to_numpy(dtype=np.float64, na_value=np.nan)
+            current = current_df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+            base, current = _quantize_for_ks(base, current)
+            
+            # KS test over all columns in one batched computation
+            _, p_values = _ks_2samp_columns(base, current)
+            
+            # if p_value < threshold, we reject H0 (same dist), so the column has drifted;
+            # a NaN p-value (missing values in the column) is treated as drift
+            drift_found = ~(p_values >= threshold)
+            drift_status = bool(drift_found.any())
+            
+            report = {
+                column: {
+                    "p_value": float(p_value),
+                    "drift_status": bool(is_found)
+                }
+                for column, p_value, is_found in zip(columns, p_values, drift_found)
+            }
             
             drift_report_file_path = self.data_validation_config.drift_report_file_path
             
@@ -110,14 +241,22 @@ class DataValidation:
             dir_path = os.path.dirname(drift_report_file_path)
             os.makedirs(dir_path, exist_ok=True)
             
-            write_yaml_file(file_path=drift_report_file_path, content=report)
+            write_json_file(file_path=drift_report_file_path, content=report)
             
             return drift_status
             
         except Exception as e:
             raise NetworkSecurityException(e, sys)
     
-    def initiate_data_validation(self) -> DataValidationArtifact:
+    def initiate_data_validation(self, force_rewrite: bool = False) -> DataValidationArtifact:
+        """
+        Run schema validation and drift detection, then place the train/test files
+        in the valid or invalid directory.
+        
+        Args:
+            force_rewrite: Re-serialize the dataframes instead of copying the source
+                files; needed once validation starts modifying the data
+        """
         try:
             train_file_path = self.data_ingestion_artifact.trained_file_path
             test_file_path = self.data_ingestion_artifact.test_file_path
@@ -127,23 +266,11 @@ class DataValidation:
             
             validation_status = True
             
-            # 1. Validate number of columns
-            status = self.validate_number_of_columns(dataframe=train_dataframe)
-            if not status:
-                validation_status = False
-            
-            status = self.validate_number_of_columns(dataframe=test_dataframe)
-            if not status:
-                validation_status = False
-                
-            # 2. Validate numerical columns
-            status = self.is_numerical_column_exist(dataframe=train_dataframe)
-            if not status:
-                validation_status = False
-            
-            status = self.is_numerical_column_exist(dataframe=test_dataframe)
-            if not status:
-                validation_status = False
+            # 1. Validate number of columns and 2. numerical columns
+            for dataframe in (train_dataframe, test_dataframe):
+                has_all_columns, has_numerical_columns = self._validate_schema(dataframe)
+                if not (has_all_columns and has_numerical_columns):
+                    validation_status = False
 
             # 3. Detect drift
             if validation_status:
@@ -178,11 +305,19 @@ class DataValidation:
             test_filename = os.path.basename(test_file_path)
 
             if validation_status:
-                train_dataframe.to_csv(self.data_validation_config.valid_train_file_path, index=False, header=True)
-                test_dataframe.to_csv(self.data_validation_config.valid_test_file_path, index=False, header=True)
+                dest_train_file_path = self.data_validation_config.valid_train_file_path
+                dest_test_file_path = self.data_validation_config.valid_test_file_path
+            else:
+                dest_train_file_path = self.data_validation_config.invalid_train_file_path
+                dest_test_file_path = self.data_validation_config.invalid_test_file_path
+
+            # Validation does not modify the data, so the source bytes are copied as is
+            if force_rewrite:
+                write_csv_file(dest_train_file_path, train_dataframe)
+                write_csv_file(dest_test_file_path, test_dataframe)
             else:
-                 train_dataframe.to_csv(self.data_validation_config.invalid_train_file_path, index=False, header=True)
-                 test_dataframe.to_csv(self.data_validation_config.invalid_test_file_path, index=False, header=True)
+                copy_file(train_file_path, dest_train_file_path)
+                copy_file(test_file_path, dest_test_file_path)
 
             # Artifact
             data_validation_artifact = DataValidationArtifact(
@@ -22,8 +22,10 @@ DATA_INGESTION_COLLECTION_NAME: str = "NetworkData"
 DATA_INGESTION_DATABASE_NAME: str = "NetworkSecurity"
 DATA_INGESTION_DIR_NAME: str = "data_ingestion"
 DATA_INGESTION_FEATURE_STORE_DIR: str = "feature_store"
+DATA_INGESTION_FEATURE_STORE_FILE_NAME: str = "phisingData.parquet"
 DATA_INGESTION_INGESTED_DIR: str = "ingested"
 DATA_INGESTION_TRAIN_TEST_SPLIT_RATIO: float = 0.2
+DATA_INGESTION_READ_WORKERS: int = 8
 
 
 ## data validation related constant start with DATA_VALIDATION VAR NAME
@@ -33,7 +35,7 @@ DATA_VALIDATION_VALID_DIR: str = "validated"
 DATA_VALIDATION_INVALID_DIR: str = "invalid"
 
 DATA_VALIDATION_DRIFT_REPORT_DIR: str = "drift_report"
-DATA_VALIDATION_DRIFT_REPORT_FILE_NAME: str = "report.yaml"
+DATA_VALIDATION_DRIFT_REPORT_FILE_NAME: str = "report.json"
 # DATA_VALIDATION_MISSING_THRESHOLD: float = 0.7
 # DATA_VALIDATION_DRIFT_THRESHOLD: float = 0.05
 
@@ -31,7 +31,7 @@ class DataIngestionConfig:
         self.feature_store_file_path: str = os.path.join(
             self.data_ingestion_dir,
             training_pipeline.DATA_INGESTION_FEATURE_STORE_DIR,
-            training_pipeline.FILE_NAME
+            training_pipeline.DATA_INGESTION_FEATURE_STORE_FILE_NAME
         )
         self.training_file_path: str = os.path.join(
             self.data_ingestion_dir,
@@ -46,6 +46,7 @@ class DataIngestionConfig:
         self.train_test_split_ratio: float = training_pipeline.DATA_INGESTION_TRAIN_TEST_SPLIT_RATIO
         self.collection_name: str = training_pipeline.DATA_INGESTION_COLLECTION_NAME
         self.database_name: str = training_pipeline.DATA_INGESTION_DATABASE_NAME
+        self.read_workers: int = training_pipeline.DATA_INGESTION_READ_WORKERS
 
 
 @dataclass
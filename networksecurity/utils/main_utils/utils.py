@@ -1,10 +1,22 @@
 import yaml
+import orjson
+from functools import lru_cache
+from typing import Union
 from networksecurity.exception.exception import NetworkSecurityException
 from networksecurity.logging.logger import logging
+from networksecurity.constant.training_pipeline import SCHEMA_FILE_PATH
 import os,sys
+import shutil
 import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 from dill import dump
 
+# Buffer CSV writes in large blocks instead of many small syscalls
+CSV_WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
 
 def read_yaml_file(file_path: str) -> dict:
     try:
@@ -13,6 +25,13 @@ def read_yaml_file(file_path: str) -> dict:
     except Exception as e:
         raise NetworkSecurityException(e, sys) from e
 
+@lru_cache(maxsize=1)
+def load_schema_config() -> dict:
+    """
+    Parse the data schema once per process; callers must not mutate the result
+    """
+    return read_yaml_file(SCHEMA_FILE_PATH)
+
 def write_yaml_file(file_path: str, content: object, replace: bool = False) -> None:
     try:
         if replace:
@@ -23,3 +42,74 @@ def write_yaml_file(file_path: str, content: object, replace: bool = False) -> N
             yaml.dump(content, file)
     except Exception as e:
         raise NetworkSecurityException(e, sys)
+
+
+def write_json_file(file_path: str, content: object, replace: bool = False) -> None:
+    try:
+        if replace:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "wb") as file:
+            file.write(orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+def dataframe_to_table(dataframe: pd.DataFrame) -> pa.Table:
+    """
+    Convert a DataFrame to an Arrow table. Object columns Arrow cannot type, such as
+    numbers mixed with strings, are converted to their str() values with missing values
+    left null, which is also how to_csv writes them, so the rows still reach validation.
+    """
+    try:
+        return pa.Table.from_pandas(dataframe, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        object_columns = dataframe.columns[dataframe.dtypes == object]
+        dataframe = dataframe.assign(**{
+            name: dataframe[name].map(lambda value: None if value is None or value != value else str(value))
+            for name in object_columns
+        })
+        return pa.Table.from_pandas(dataframe, preserve_index=False)
+
+
+def write_csv_file(file_path: str, dataframe: Union[pd.DataFrame, pa.Table]) -> None:
+    """
+    Write a DataFrame or Arrow table to CSV with pyarrow's multithreaded C writer
+    """
+    try:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        table = dataframe
+        if isinstance(dataframe, pd.DataFrame):
+            table = dataframe_to_table(dataframe)
+        with pa.output_stream(file_path, buffer_size=CSV_WRITE_BUFFER_SIZE) as sink:
+            # Unquoted header, cells quoted only when needed: the same format DataFrame.to_csv produced
+            write_options = pa_csv.WriteOptions(include_header=True, quoting_header="none")
+            pa_csv.write_csv(table, sink, write_options=write_options)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+
+def copy_file(src_file_path: str, dst_file_path: str) -> None:
+    """
+    Copy src to dst as an independent file (kernel-side copy on Linux), so later
+    rewrites of either never show up in the other. An existing dst is replaced.
+    """
+    try:
+        os.makedirs(os.path.dirname(dst_file_path), exist_ok=True)
+        # Unlink first so a dst left hard-linked to src is detached rather than copied onto itself
+        if os.path.exists(dst_file_path):
+            os.remove(dst_file_path)
+        shutil.copyfile(src_file_path, dst_file_path)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+
+def write_parquet_file(file_path: str, table: pa.Table) -> None:
+    """
+    Write an Arrow table to Parquet using fast zstd compression
+    """
+    try:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        pq.write_table(table, file_path, compression="zstd", compression_level=1)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
@@ -0,0 +1,61 @@
+import os,sys
+import threading
+
+import certifi
+import pymongo
+from dotenv import load_dotenv
+from pymongo.server_api import ServerApi
+
+from networksecurity.exception.exception import NetworkSecurityException
+
+_env_loaded = False
+
+# The process-wide client and the URL it was created for
+_client = None
+_client_url = None
+_client_lock = threading.Lock()
+
+
+def load_env_once() -> None:
+    """
+    Load .env from the current directory the first time it is needed in this process
+    """
+    global _env_loaded
+    if not _env_loaded:
+        load_dotenv()
+        _env_loaded = True
+
+
+def _create_mongo_client(mongo_db_url: str) -> pymongo.MongoClient:
+    # maxPoolSize=50 halves pymongo's default of 100 to bound open sockets while still
+    # covering the parallel ingestion cursors. ServerApi('1') pins the Stable API, as test_db.py did.
+    return pymongo.MongoClient(
+        mongo_db_url,
+        tlsCAFile=certifi.where(),
+        maxPoolSize=50,
+        server_api=ServerApi('1')
+    )
+
+
+def get_mongo_client() -> pymongo.MongoClient:
+    """
+    Return the process-wide MongoClient for the current MONGO_DB_URL.
+
+    MongoClient is a connection pool, so it is created once and reused by every
+    caller instead of paying the TLS handshake and topology discovery per run.
+    The URL is read on every call; if MONGO_DB_URL changed, the previous client is
+    closed (releasing its sockets and monitor threads) and a new one is created.
+    """
+    global _client, _client_url
+    try:
+        load_env_once()
+        mongo_db_url = os.getenv("MONGO_DB_URL")
+        with _client_lock:
+            if _client is None or _client_url != mongo_db_url:
+                if _client is not None:
+                    _client.close()
+                _client = _create_mongo_client(mongo_db_url)
+                _client_url = mongo_db_url
+            return _client
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
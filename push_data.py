@@ -2,8 +2,8 @@ import os
 import sys
 import json
 
-from dotenv import load_dotenv
-load_dotenv()
+from networksecurity.utils.mongo_utils.utils import load_env_once
+load_env_once()
 
 import certifi
 ca=certifi.where()
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+
+from networksecurity.components.data_ingestion import DataIngestion, _concat_columns, _read_documents
+from networksecurity.entity.config_entity import DataIngestionConfig, TrainingPipelineConfig
+
+
+def test_read_documents_keeps_extra_fields_and_leaves_absent_fields_out():
+    documents = [{"port": 1, "extra": "x"}, {"port": "na"}, {"port": -1}]
+
+    columns = _read_documents(iter(documents), n_rows=1)
+
+    assert list(columns) == ["port", "extra"]
+    np.testing.assert_array_equal(columns["port"], [1.0, np.nan, -1.0])
+    assert columns["extra"][0] == "x" and np.isnan(columns["extra"][1:].astype(float)).all()
+
+
+def test_read_documents_stores_values_without_rounding():
+    documents = [
+        {"URL_Length": 1, "port": 2 ** 60 + 1, "flag": True},
+        {"URL_Length": 0.5, "port": 1, "flag": False}
+    ]
+
+    columns = _read_documents(iter(documents), n_rows=2)
+
+    np.testing.assert_array_equal(columns["URL_Length"], [1.0, 0.5])
+    assert columns["port"].dtype == np.int64 and columns["port"][0] == 2 ** 60 + 1
+    assert columns["flag"].dtype == bool
+
+
+def test_concat_columns_fills_fields_missing_from_a_range():
+    parts = [
+        {"port": np.array([1.0, 2.0])},
+        {},
+        {"port": np.array([3.0]), "Result": np.array([1.0])}
+    ]
+
+    columns = _concat_columns(parts)
+
+    np.testing.assert_array_equal(columns["port"], [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(columns["Result"], [np.nan, np.nan, 1.0])
+
+
+def test_concat_columns_keeps_large_integers_exact():
+    parts = [{"port": np.array([2 ** 60 + 1])}, {"port": np.array([0.5])}]
+
+    columns = _concat_columns(parts)
+
+    assert columns["port"].tolist() == [2 ** 60 + 1, 0.5]
+
+
+def test_split_data_as_train_test_writes_mixed_value_columns(tmp_path):
+    data_ingestion_config = DataIngestionConfig(TrainingPipelineConfig())
+    data_ingestion_config.training_file_path = str(tmp_path / "train.csv")
+    data_ingestion_config.testing_file_path = str(tmp_path / "test.csv")
+    dataframe = pd.DataFrame({
+        "URL_Length": np.array(["abc", 1.0, -1.0, np.nan, 1.0], dtype=object),
+        "port": [1, -1, 1, 1, -1]
+    })
+
+    train_table, test_table = DataIngestion(data_ingestion_config).split_data_as_train_test(dataframe)
+
+    written = pd.concat([pd.read_csv(data_ingestion_config.training_file_path),
+                         pd.read_csv(data_ingestion_config.testing_file_path)])
+    assert train_table.num_rows + test_table.num_rows == len(written) == 5
+    assert sorted(written["URL_Length"].dropna().astype(str)) == ["-1.0", "1.0", "1.0", "abc"]
@@ -0,0 +1,70 @@
+import json
+
+import numpy as np
+import pandas as pd
+from scipy.stats import ks_2samp
+
+from networksecurity.components.data_validation import DataValidation, _ks_2samp_columns
+from networksecurity.entity.artifact_entity import DataIngestionArtifact
+from networksecurity.entity.config_entity import DataValidationConfig, TrainingPipelineConfig
+
+
+def test_ks_2samp_columns_matches_scipy():
+    rng = np.random.default_rng(0)
+    base = rng.integers(-1, 2, size=(40, 3)).astype(np.float64)
+    current = rng.integers(0, 2, size=(25, 3)).astype(np.float64)
+
+    statistic, pvalue = _ks_2samp_columns(base, current)
+
+    for j in range(base.shape[1]):
+        expected = ks_2samp(base[:, j], current[:, j])
+        assert np.isclose(statistic[j], expected.statistic)
+        assert np.isclose(pvalue[j], expected.pvalue)
+
+
+def test_ks_2samp_columns_propagates_nan():
+    base = np.array([[1.0, 1.0], [np.nan, 2.0], [2.0, 3.0]])
+    current = np.array([[1.0, 1.0], [np.nan, 5.0]])
+
+    statistic, pvalue = _ks_2samp_columns(base, current)
+
+    assert np.isnan(statistic[0]) and np.isnan(pvalue[0])
+    expected = ks_2samp(base[:, 1], current[:, 1])
+    assert np.isclose(statistic[1], expected.statistic)
+    assert np.isclose(pvalue[1], expected.pvalue)
+
+
+def test_detect_dataset_drift_flags_nan_column(tmp_path):
+    data_validation_config = DataValidationConfig(TrainingPipelineConfig())
+    data_validation_config.drift_report_file_path = str(tmp_path / "report.json")
+    data_validation = DataValidation(
+        DataIngestionArtifact(trained_file_path="", test_file_path=""),
+        data_validation_config
+    )
+    base_df = pd.DataFrame({"URL_Length": [1.0, np.nan, -1.0], "port": [1.0, -1.0, 1.0]})
+    current_df = pd.DataFrame({"URL_Length": [1.0, -1.0], "port": [1.0, -1.0]})
+
+    assert data_validation.detect_dataset_drift(base_df, current_df)
+
+    with open(data_validation_config.drift_report_file_path) as report_file:
+        report = json.load(report_file)
+    assert report["URL_Length"] == {"p_value": None, "drift_status": True}
+    assert report["port"]["drift_status"] is False
+
+
+def test_detect_dataset_drift_keeps_fractions_in_integer_column(tmp_path):
+    data_validation_config = DataValidationConfig(TrainingPipelineConfig())
+    data_validation_config.drift_report_file_path = str(tmp_path / "report.json")
+    data_validation = DataValidation(
+        DataIngestionArtifact(trained_file_path="", test_file_path=""),
+        data_validation_config
+    )
+    base_df = pd.DataFrame({"URL_Length": [0.5, 1.0, 1.0, 0.5, 2.0, 0.5]})
+    current_df = pd.DataFrame({"URL_Length": [1.0, 1.0, 1.0, 1.0]})
+
+    data_validation.detect_dataset_drift(base_df, current_df)
+
+    with open(data_validation_config.drift_report_file_path) as report_file:
+        report = json.load(report_file)
+    expected = ks_2samp(base_df["URL_Length"], current_df["URL_Length"])
+    assert np.isclose(report["URL_Length"]["p_value"], expected.pvalue)